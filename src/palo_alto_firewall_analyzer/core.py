@@ -10,19 +10,25 @@ import typing
 import xml.etree.ElementTree
 import xmltodict
 
+from palo_alto_firewall_analyzer import dns_cache
 from palo_alto_firewall_analyzer.pan_config import PanConfig
 
 logger = logging.getLogger(__name__)
 
 # A registry is used to auto-register the policy validators and fixers.
 policy_validator_registry = {}
+# Validators that always run in the main process, even when others run in a process pool,
+# such as those making API requests or sharing DNS lookups with another validator
+main_process_policy_validator_registry = set()
 
 
-def register_policy_validator(readable_name, description):
+def register_policy_validator(readable_name, description, main_process_only=False):
     def inner_decorator(f):
         if readable_name in policy_validator_registry:
             raise KeyError(f"Name '{readable_name}' already in use!")
         policy_validator_registry[readable_name] = (readable_name, description, f)
+        if main_process_only:
+            main_process_policy_validator_registry.add(readable_name)
         return f
 
     return inner_decorator
@@ -32,6 +38,10 @@ def get_policy_validators():
     return policy_validator_registry
 
 
+def get_main_process_policy_validators():
+    return main_process_policy_validator_registry
+
+
 policy_fixer_registry = {}
 
 
@@ -158,13 +168,18 @@ BadEntry = collections.namedtuple('BadEntry', ['data', 'text', 'device_group', '
 
 @functools.lru_cache(maxsize=None)
 def cached_dns_lookup(domain):
+    found, result = dns_cache.get(domain)
+    if found:
+        logger.debug(f"DNS cache - Domain:{domain} resolved to:{result}")
+        return result
     try:
         result = socket.gethostbyname(domain)
         logger.debug(f"gethostbyname() Domain:{domain} resolved to:{result}")
-        return result
     except socket.gaierror:
         logger.debug(f"gethostbyname() Domain:{domain} failed to resolve")
-        return None
+        result = None
+    dns_cache.put(domain, result)
+    return result
 
 
 @functools.lru_cache(maxsize=None)
@@ -189,6 +204,80 @@ def cached_fqdn_lookup(domain):
         return None
 
 
+def get_member_texts(entry, container_tag):
+    """Returns the text of each <member> inside an entry's container element, such as 'source' or 'static'"""
+    container = entry.find(container_tag)
+    if container is None:
+        return []
+    return [member.text for member in container.findall('member')]
+
+
+def build_address_columns(entries):
+    """Converts a list of Address entries into parallel lists ("columns") of their names and FQDNs.
+    xml_ref holds the original entries, for use in BadEntry.data"""
+    return {
+        'name': [entry.get('name') for entry in entries],
+        'fqdn': [[fqdn_node.text for fqdn_node in entry.findall('fqdn')] for entry in entries],
+        'xml_ref': list(entries),
+    }
+
+
+def build_address_group_columns(entries):
+    """Converts a list of AddressGroup entries into parallel lists of their names and static members"""
+    return {
+        'name': [entry.get('name') for entry in entries],
+        'members': [get_member_texts(entry, 'static') for entry in entries],
+        'xml_ref': list(entries),
+    }
+
+
+def build_rule_columns(entries):
+    """Converts a list of policy entries into parallel lists of their names,
+    source and destination members, and whether they're disabled"""
+    disabled = []
+    for entry in entries:
+        disabled_node = entry.find('disabled')
+        disabled.append(disabled_node is not None and disabled_node.text == 'yes')
+    return {
+        'name': [entry.get('name') for entry in entries],
+        'source_members': [get_member_texts(entry, 'source') for entry in entries],
+        'dest_members': [get_member_texts(entry, 'destination') for entry in entries],
+        'disabled': disabled,
+        'xml_ref': list(entries),
+    }
+
+
+COLUMN_BUILDERS = {
+    'Addresses': build_address_columns,
+    'AddressGroups': build_address_group_columns,
+    **{policy_type: build_rule_columns for policy_type in PanConfig.SUPPORTED_POLICY_TYPES},
+}
+
+
+def get_entry_columns(dg_objects, entry_type):
+    """Returns the column view of dg_objects[entry_type], where dg_objects is a single
+    device group's devicegroup_objects or devicegroup_exclusive_objects.
+    load_config_package builds these up front; they're otherwise built on first use."""
+    columns_key = entry_type + '_soa'
+    if columns_key not in dg_objects:
+        if entry_type not in COLUMN_BUILDERS:
+            raise Exception(
+                f"Invalid entry_type '{entry_type}' ! entry_type must be one of {COLUMN_BUILDERS.keys()}")
+        dg_objects[columns_key] = COLUMN_BUILDERS[entry_type](dg_objects[entry_type])
+    return dg_objects[columns_key]
+
+
+def get_entries_by_name(dg_objects, entry_type):
+    """Returns a mapping of names to entries for dg_objects[entry_type], where dg_objects
+    is a single device group's devicegroup_objects. Like get_entry_columns, load_config_package
+    builds these up front for each object type, and they're otherwise built on first use.
+    The mapping is shared, so callers that modify it need to make a copy first."""
+    by_name_key = entry_type + '_by_name'
+    if by_name_key not in dg_objects:
+        dg_objects[by_name_key] = {entry.get('name'): entry for entry in dg_objects[entry_type]}
+    return dg_objects[by_name_key]
+
+
 @functools.lru_cache(maxsize=None)
 def xml_object_to_dict1(xml_obj):
     obj_xml_string = xml.etree.ElementTree.tostring(xml_obj)
@@ -220,6 +309,11 @@ def xml_object_to_dict(xml_obj):
     return obj_dict
 
 
+def dict_to_xml_entry(obj_dict):
+    """Converts an entry's dict, as returned by xml_object_to_dict(...)['entry'], back to an XML string"""
+    return xmltodict.unparse({'entry': obj_dict}, full_document=False)
+
+
 @functools.lru_cache(maxsize=None)
 def get_single_ip_from_address(address_entry):
     """
@@ -243,12 +337,17 @@ def get_single_ip_from_address(address_entry):
 
 
 def _squash_devicegroup(device_group, device_group_hierarchy_children):
-    """Recursive function for determining all of a device group's child device groups"""
-    result = [device_group]
-    if device_group in device_group_hierarchy_children:
-        for child_dg in device_group_hierarchy_children[device_group]:
-            result += _squash_devicegroup(child_dg, device_group_hierarchy_children)
-    return sorted(result)
+    """Determines all of a device group's child device groups, including itself,
+    with a breadth-first walk of the hierarchy"""
+    visited = {device_group}
+    to_visit = collections.deque([device_group])
+    while to_visit:
+        # .get() avoids adding keys to device_group_hierarchy_children, which is a defaultdict
+        for child_dg in device_group_hierarchy_children.get(to_visit.popleft(), ()):
+            if child_dg not in visited:
+                visited.add(child_dg)
+                to_visit.append(child_dg)
+    return sorted(visited)
 
 
 def squash_all_devicegroups(device_groups, device_group_hierarchy_children):
@@ -0,0 +1,89 @@
+"""
+Persistent cache of DNS lookups, so that repeated runs don't need to
+resolve every FQDN again. The cache is stored in a SQLite database, which
+is loaded into memory once when enabled and written back once when saved.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600
+# FQDNs that failed to resolve are retried sooner, as they might be temporary failures
+NEGATIVE_TTL = 300
+
+
+class DNSCache:
+    """
+    Maps FQDNs to the IP they resolved to, or None if they didn't resolve.
+    Entries older than their TTL are ignored.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL, negative_ttl=NEGATIVE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = min(ttl, negative_ttl)
+        self.entries = {}
+        self.new_entries = {}
+
+    def load(self):
+        now = int(time.time())
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS dns_cache (fqdn TEXT PRIMARY KEY, ip TEXT, resolved_at INTEGER)")
+            rows = conn.execute("SELECT fqdn, ip, resolved_at FROM dns_cache WHERE resolved_at > ?", (now - self.ttl,))
+            for fqdn, ip, resolved_at in rows:
+                if ip is None and resolved_at <= now - self.negative_ttl:
+                    continue
+                self.entries[fqdn] = ip
+        conn.close()
+        logger.debug(f"Loaded {len(self.entries)} DNS cache entries from {self.path}")
+
+    def get(self, fqdn):
+        """Returns a tuple of whether the FQDN was found, and the IP it resolved to"""
+        if fqdn in self.entries:
+            return True, self.entries[fqdn]
+        return False, None
+
+    def put(self, fqdn, ip):
+        self.entries[fqdn] = ip
+        self.new_entries[fqdn] = (ip, int(time.time()))
+
+    def save(self):
+        if not self.new_entries:
+            return
+        with sqlite3.connect(self.path) as conn:
+            conn.executemany("INSERT OR REPLACE INTO dns_cache (fqdn, ip, resolved_at) VALUES (?, ?, ?)",
+                             [(fqdn, ip, resolved_at) for fqdn, (ip, resolved_at) in self.new_entries.items()])
+        conn.close()
+        logger.debug(f"Saved {len(self.new_entries)} new DNS cache entries to {self.path}")
+        self.new_entries = {}
+
+
+# The cache used by core.cached_dns_lookup. Persistent caching is disabled until enable() is called.
+_dns_cache = None
+
+
+def enable(path, ttl=DEFAULT_TTL):
+    global _dns_cache
+    _dns_cache = DNSCache(path, ttl)
+    _dns_cache.load()
+
+
+def get(fqdn):
+    if _dns_cache is None:
+        return False, None
+    return _dns_cache.get(fqdn)
+
+
+def put(fqdn, ip):
+    if _dns_cache is not None:
+        _dns_cache.put(fqdn, ip)
+
+
+def save():
+    if _dns_cache is not None:
+        _dns_cache.save()
@@ -1,15 +1,15 @@
 import logging
 
-from palo_alto_firewall_analyzer.core import register_policy_fixer, get_policy_validators
+from palo_alto_firewall_analyzer.core import register_policy_fixer, get_policy_validators, dict_to_xml_entry
 from palo_alto_firewall_analyzer import pan_api
 
 logger = logging.getLogger(__name__)
 
+
 def consolidate_service_like_objects(profilepackage, object_friendly_type, validator_function):
     panorama = profilepackage.settings.get("Panorama")
     api_key = profilepackage.api_key
     pan_config = profilepackage.pan_config
-    version = pan_config.get_major_version()
 
     logger.info("*"*80)
     logger.info(f"Checking for unused {object_friendly_type} objects to consolidate")
@@ -20,14 +20,15 @@ def consolidate_service_like_objects(profilepackage, object_friendly_type, valid
         return badentries_needing_consolidation
 
     logger.info(f"Replacing the contents of {len(badentries_needing_consolidation)} Objects and Policies" )
+    # Send all of the replacements in a single transaction, instead of one API request per entry
+    operations = []
     for badentry in badentries_needing_consolidation:
         object_policy_entry, object_policy_dict = badentry.data
         object_policy_dg = badentry.device_group
         object_policy_type = badentry.entry_type
-        if object_policy_type in pan_config.SUPPORTED_OBJECT_TYPES:
-            pan_api.update_devicegroup_object(panorama, version, api_key, object_policy_dict, object_policy_type, object_policy_dg)
-        elif object_policy_type in pan_config.SUPPORTED_POLICY_TYPES:
-            pan_api.update_devicegroup_policy(panorama, version, api_key, object_policy_dict, object_policy_type, object_policy_dg)
+        xpath = pan_config.get_api_xpath(object_policy_type, object_policy_dg, object_policy_dict['@name'])
+        operations.append(('edit', xpath, dict_to_xml_entry(object_policy_dict)))
+    pan_api.multi_config(panorama, api_key, operations)
     pan_api.validate_commit(panorama, api_key)
     logger.info("Replacement complete. Please commit in the firewall.")
     return badentries_needing_consolidation
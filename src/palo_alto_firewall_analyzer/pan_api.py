@@ -12,10 +12,18 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# A single session is shared by all API requests, so that connections to each
+# Panorama and firewall are kept alive and reused, instead of a new TLS handshake per request
+_session = requests.Session()
+
 ###############################################################################
 # API functions
 ###############################################################################
 
+def close_session():
+    _session.close()
+
+
 def pan_api(firewall, method, path, params, api_key=None, data=None):
     url = "https://{hostname}{path}".format(hostname=firewall, path=path)
     headers = {}
@@ -24,7 +32,7 @@ def pan_api(firewall, method, path, params, api_key=None, data=None):
 
     # Try 3 times, in case of weird issues where the API responds 200, but with no data:
     for i in range(3):
-        response = requests.request(method, url, params=params, headers=headers, data=data, verify=False)
+        response = _session.request(method, url, params=params, headers=headers, data=data, verify=False)
         logger.debug(response.url)
         logger.debug(response.status_code)
         logger.debug(response.text)
@@ -71,6 +79,30 @@ def validate_commit(firewall, api_key):
     return response.text
 
 
+def multi_config(panorama, api_key, operations):
+    """Applies several configuration changes in a single transaction.
+    operations is a list of (action, xpath, element) tuples, where action is a
+    config action such as 'edit' or 'set', and element is an XML string"""
+    multi_configure_request = xml.etree.ElementTree.Element('multi-configure-request')
+    for request_id, (action, xpath, element) in enumerate(operations, 1):
+        request = xml.etree.ElementTree.SubElement(multi_configure_request, action, id=str(request_id), xpath=xpath)
+        request.append(xml.etree.ElementTree.fromstring(element))
+
+    params = {
+        'type': 'config',
+        'action': 'multi-config',
+        'strict-transactional': 'yes',
+    }
+    data = {'element': xml.etree.ElementTree.tostring(multi_configure_request, encoding='unicode')}
+    response = pan_api(panorama, method="post", path="/api", params=params, data=data, api_key=api_key)
+
+    root = xml.etree.ElementTree.fromstring(response.text)
+    if root.get('status') != 'success':
+        raise Exception("Multi-config request failed! " + response.text)
+
+    return response.text
+
+
 @functools.lru_cache(maxsize=None)
 def export_configuration(firewall, api_key):
     params = {
@@ -136,6 +168,27 @@ def get_interface_zone(firewall, api_key, interface):
     return zone
 
 
+@functools.lru_cache(maxsize=None)
+def get_interface_zones(firewall, api_key):
+    """Returns a mapping of all of a firewall's interfaces to their zones, from a single API request.
+    Interfaces without a zone are left out"""
+    params = {
+        'type': 'op',
+        'cmd': '<show><interface>all</interface></show>'
+    }
+
+    response = pan_api(firewall, method="get", path="/api", params=params, api_key=api_key)
+
+    interface_zones = {}
+    root = xml.etree.ElementTree.fromstring(response.text)
+    for interface_elem in root.findall('./result/ifnet/entry'):
+        name = interface_elem.findtext('name')
+        zone = interface_elem.findtext('zone')
+        if name and zone:
+            interface_zones[name] = zone
+    return interface_zones
+
+
 @functools.lru_cache(maxsize=None)
 def get_device_groups_and_firewalls(panorama, api_key):
     """Returns a mapping of device groups to associated firewall hostnames"""
@@ -347,10 +400,8 @@ def delete_policy(panorama, version, api_key, policy_type, policy_name, device_g
     return response.json()
 
 
-def update_devicegroup_policy(panorama, version, api_key, policy, policytype, device_group):
-    if policytype not in SUPPORTED_POLICY_TYPES:
-        raise Exception(f"Invalid policytype '{policytype}' ! polictype must be one of {SUPPORTED_POLICY_TYPES}")
-
+def _build_update_request(version, entry, entry_category, entry_type, device_group):
+    """Returns the path, params, and data for a REST API request that replaces an entry in a device group"""
     # 'shared' is a reserved name by PA and not allowed to be used as a device group name
     if device_group == 'shared':
         location_type = 'shared'
@@ -358,7 +409,7 @@ def update_devicegroup_policy(panorama, version, api_key, policy, policytype, de
         location_type = 'device-group'
     assert location_type in SUPPORTED_LOCATION_TYPES
 
-    path = f"/restapi/v{version}/Policies/{policytype}"
+    path = f"/restapi/v{version}/{entry_category}/{entry_type}"
     params = {
         'output-format': 'json',
         'location': location_type
@@ -367,9 +418,16 @@ def update_devicegroup_policy(panorama, version, api_key, policy, policytype, de
     if location_type == 'device-group':
         params['device-group'] = device_group
 
-    params['name'] = policy['@name']
-    data = json.dumps({'entry': [policy]})
+    params['name'] = entry['@name']
+    data = json.dumps({'entry': [entry]})
+    return path, params, data
+
+
+def update_devicegroup_policy(panorama, version, api_key, policy, policytype, device_group):
+    if policytype not in SUPPORTED_POLICY_TYPES:
+        raise Exception(f"Invalid policytype '{policytype}' ! polictype must be one of {SUPPORTED_POLICY_TYPES}")
 
+    path, params, data = _build_update_request(version, policy, 'Policies', policytype, device_group)
     response = pan_api(panorama, method="put", path=path, params=params, data=data, api_key=api_key)
 
     return response.json()
@@ -379,25 +437,7 @@ def update_devicegroup_object(panorama, version, api_key, object_entry, objectty
     if objecttype not in SUPPORTED_OBJECT_TYPES:
         raise Exception(f"Invalid objecttype '{objecttype}'! objecttype must be one of {SUPPORTED_OBJECT_TYPES}")
 
-    # 'shared' is a reserved name by PA and not allowed to be used as a device group name
-    if device_group == 'shared':
-        location_type = 'shared'
-    else:
-        location_type = 'device-group'
-    assert location_type in SUPPORTED_LOCATION_TYPES
-
-    path = f"/restapi/v{version}/Objects/{objecttype}"
-    params = {
-        'output-format': 'json',
-        'location': location_type
-    }
-
-    if location_type == 'device-group':
-        params['device-group'] = device_group
-
-    params['name'] = object_entry['@name']
-    data = json.dumps({'entry': [object_entry]})
-
+    path, params, data = _build_update_request(version, object_entry, 'Objects', objecttype, device_group)
     response = pan_api(panorama, method="put", path=path, params=params, data=data, api_key=api_key)
 
     return response.json()
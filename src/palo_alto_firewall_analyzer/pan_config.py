@@ -21,17 +21,25 @@ class PanConfig:
     will be the same as those used with the XML API.
     """
 
-    def __init__(self, configdata: str, from_file=False):
+    def __init__(self, configdata, from_file=False):
+        """configdata is either the XML configuration as a string, or an open file with it.
+        from_file indicates the configuration is an exported file, instead of an API response"""
+        if hasattr(configdata, 'read'):
+            # Parse incrementally from the file, instead of first reading the entire file into memory
+            configroot = xml.etree.ElementTree.parse(configdata).getroot()
+        else:
+            configroot = xml.etree.ElementTree.fromstring(configdata)
+
         if from_file:
             # fake_response = xml.etree.ElementTree.Element('response')
-            conf = xml.etree.ElementTree.fromstring(configdata)
+            conf = configroot
             fake_result = xml.etree.ElementTree.Element('result')
             fake_result.append(conf)
             # fake_response.append(fake_result)
             self.configroot = fake_result
             self.config_xml = {"version": conf.get("version"),"urldb": conf.get("urldb"),"detail-version":conf.get("detail-version")}
         else:
-            self.configroot = xml.etree.ElementTree.fromstring(configdata).find('./result')
+            self.configroot = configroot.find('./result')
 
     @functools.lru_cache(maxsize=None)
     def get_device_groups(self):
@@ -68,6 +76,12 @@ class PanConfig:
         'device-group': "./config/devices/entry/device-group/entry[@name='{device_group}']/"
     }
 
+    # The same locations, as xpaths for the XML API
+    API_LOCATION_TYPES = {
+        'shared': "/config/shared/",
+        'device-group': "/config/devices/entry[@name='localhost.localdomain']/device-group/entry[@name='{device_group}']/"
+    }
+
     SUPPORTED_POLICY_TYPES = {
         "SecurityPreRules": "pre-rulebase/security/rules/",
         "SecurityPostRules": "post-rulebase/security/rules/",
@@ -129,18 +143,20 @@ class PanConfig:
         # "Schedules",
     }
 
+    @staticmethod
+    def get_location_type(device_group):
+        # 'shared' is a reserved name by PA and not allowed to be used as a device group name
+        if device_group == 'shared':
+            return 'shared'
+        return 'device-group'
+
     @functools.lru_cache(maxsize=None)
     def get_devicegroup_policy(self, policy_type, device_group):
         if policy_type not in self.SUPPORTED_POLICY_TYPES:
             raise Exception(
                 f"Invalid policy_type '{policy_type}' ! policy_type must be one of {self.SUPPORTED_POLICY_TYPES.keys()}")
 
-        # 'shared' is a reserved name by PA and not allowed to be used as a device group name
-        if device_group == 'shared':
-            location_type = 'shared'
-        else:
-            location_type = 'device-group'
-        assert location_type in self.SUPPORTED_LOCATION_TYPES
+        location_type = self.get_location_type(device_group)
         xpath_location_prefix = self.SUPPORTED_LOCATION_TYPES[location_type].format(device_group=device_group)
         xpath = xpath_location_prefix + self.SUPPORTED_POLICY_TYPES[policy_type]
         return self.configroot.findall(xpath)
@@ -152,16 +168,24 @@ class PanConfig:
             raise Exception(
                 f"Invalid object_type '{object_type}' ! object_type must be one of {self.SUPPORTED_OBJECT_TYPES.keys()}")
 
-        # 'shared' is a reserved name by PA and not allowed to be used as a device group name
-        if device_group == 'shared':
-            location_type = 'shared'
-        else:
-            location_type = 'device-group'
-        assert location_type in self.SUPPORTED_LOCATION_TYPES
+        location_type = self.get_location_type(device_group)
         xpath_location_prefix = self.SUPPORTED_LOCATION_TYPES[location_type].format(device_group=device_group)
         xpath = xpath_location_prefix + self.SUPPORTED_OBJECT_TYPES[object_type]
         return self.configroot.findall(xpath)
 
+    def get_api_xpath(self, entry_type, device_group, entry_name):
+        '''Returns the XML API xpath of a single policy or object in a specific device group'''
+        if entry_type in self.SUPPORTED_POLICY_TYPES:
+            entry_type_path = self.SUPPORTED_POLICY_TYPES[entry_type]
+        elif entry_type in self.SUPPORTED_OBJECT_TYPES:
+            entry_type_path = self.SUPPORTED_OBJECT_TYPES[entry_type]
+        else:
+            raise Exception(f"Invalid entry_type '{entry_type}' ! entry_type must be a supported policy or object type")
+
+        location_type = self.get_location_type(device_group)
+        xpath_location_prefix = self.API_LOCATION_TYPES[location_type].format(device_group=device_group)
+        return xpath_location_prefix + entry_type_path + f"entry[@name='{entry_name}']"
+
     def get_devicegroup_all_objects(self, object_type, device_group):
         '''Returns all objects available to a device group including those from parent objects'''
         _, device_group_hierarchy_parent = self.get_device_groups_hierarchy()
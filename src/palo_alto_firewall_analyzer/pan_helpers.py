@@ -1,25 +1,67 @@
 import collections
 import functools
 import getpass
+import itertools
 import logging
 import os
 import os.path
 
 from palo_alto_firewall_analyzer import pan_api
 from palo_alto_firewall_analyzer.pan_config import PanConfig
-from palo_alto_firewall_analyzer.core import squash_all_devicegroups, ProfilePackage
+from palo_alto_firewall_analyzer.core import squash_all_devicegroups, get_entry_columns, get_entries_by_name, ProfilePackage
 
 logger = logging.getLogger(__name__)
 
 
+def _collect_dg_entries(pan_config, device_group, limit, all_child_device_groups, all_active_child_firewalls):
+    """Returns a mapping of each supported policy and object type to a device group's entries,
+    along with the device group's children and their active firewalls"""
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+    object_types = pan_config.SUPPORTED_OBJECT_TYPES
+    get_dg_pol = pan_config.get_devicegroup_policy
+    get_dg_obj = pan_config.get_devicegroup_object
+
+    dg_entries = {
+        **{policy_type: get_dg_pol(policy_type, device_group)[:limit] for policy_type in policy_types},
+        **{object_type: get_dg_obj(object_type, device_group) for object_type in object_types},
+        'all_child_device_groups': all_child_device_groups,
+        'all_active_child_firewalls': all_active_child_firewalls,
+    }
+    for object_type in object_types:
+        get_entries_by_name(dg_entries, object_type)
+    # Materialize the column views used by the validators' hot loops once, up front
+    for entry_type in ('Addresses', 'AddressGroups', *policy_types):
+        get_entry_columns(dg_entries, entry_type)
+    return dg_entries
+
+
+def _collect_dg_exclusive_entries(pan_config, devicegroup_objects, device_group, device_group_hierarchy_parent):
+    """Returns a mapping of each supported policy type to the policies exclusive to a device group,
+    which won't include policies inherited from the parent device groups"""
+    dgo = devicegroup_objects[device_group]
+    parent_dg = device_group_hierarchy_parent.get(device_group)
+
+    dg_exclusive_entries = {}
+    for policy_type in pan_config.SUPPORTED_POLICY_TYPES:
+        if parent_dg is None:
+            # No parent means no inherited policies
+            dg_exclusive_entries[policy_type] = dgo[policy_type]
+        else:
+            parent_policy_uuids = set([entry.get('@uuid') for entry in devicegroup_objects[parent_dg][policy_type]])
+            exclusive_objects = [entry for entry in dgo[policy_type] if
+                                 entry.get('@uuid') not in parent_policy_uuids]
+            dg_exclusive_entries[policy_type] = exclusive_objects
+        get_entry_columns(dg_exclusive_entries, policy_type)
+    return dg_exclusive_entries
+
+
 def load_config_package(configuration_settings, api_key, device_group, limit, xml_file=None):
     if xml_file:
         # The list of firewalls are not available from the API, so
         # these variables will remain empty
         logger.debug(f"Loading configuration from XML file: {xml_file}")
         with open(xml_file, encoding='utf-8') as fh:
-            xml_config = fh.read()
-        pan_config = PanConfig(xml_config, True)
+            pan_config = PanConfig(fh, True)
         device_groups_and_firewalls = collections.defaultdict(list)
         active_firewalls_per_devicegroup = collections.defaultdict(list)
     else:
@@ -30,7 +72,7 @@ def load_config_package(configuration_settings, api_key, device_group, limit, xm
         logger.debug(f"Loading downloaded XML configuration")
         pan_config = PanConfig(xml_config)
         device_groups_and_firewalls = pan_api.get_device_groups_and_firewalls(panorama, api_key)
-        active_firewalls = pan_api.get_active_firewalls(panorama, api_key)
+        active_firewalls = set(pan_api.get_active_firewalls(panorama, api_key))
         # Build the mapping of active FWs in each device group
         active_firewalls_per_devicegroup = collections.defaultdict(list)
         for dg, firewalls in device_groups_and_firewalls.items():
@@ -45,48 +87,30 @@ def load_config_package(configuration_settings, api_key, device_group, limit, xm
 
     all_active_firewalls_per_devicegroup = collections.defaultdict(list)
     for dg, child_dgs in devicegroups_to_child_devicegroups.items():
-        all_active_firewalls_per_devicegroup[dg] = []
-        for child_dg in child_dgs:
-            all_active_firewalls_per_devicegroup[dg] += active_firewalls_per_devicegroup[child_dg]
-
-    # Create and fill in the devicegroup_objects, which represents all entries, per devicegroup
-    devicegroup_objects = {}
+        all_active_firewalls_per_devicegroup[dg] = list(itertools.chain.from_iterable(
+            active_firewalls_per_devicegroup[child_dg] for child_dg in child_dgs))
 
     if device_group:
         device_groups = [device_group]
     else:
         device_groups = all_device_groups
 
-    for device_group in all_device_groups:
-        devicegroup_objects[device_group] = {}
-        devicegroup_objects[device_group]['all_child_device_groups'] = devicegroups_to_child_devicegroups[device_group]
-        devicegroup_objects[device_group]['all_active_child_firewalls'] = all_active_firewalls_per_devicegroup[
-            device_group]
-
-        for policy_type in pan_config.SUPPORTED_POLICY_TYPES:
-            devicegroup_objects[device_group][policy_type] = pan_config.get_devicegroup_policy(policy_type, device_group)[:limit]
-        for object_type in pan_config.SUPPORTED_OBJECT_TYPES:
-            devicegroup_objects[device_group][object_type] = pan_config.get_devicegroup_object(object_type, device_group)
+    # Create and fill in the devicegroup_objects, which represents all entries, per devicegroup
+    devicegroup_objects = {
+        dg: _collect_dg_entries(pan_config, dg, limit, devicegroups_to_child_devicegroups[dg],
+                                all_active_firewalls_per_devicegroup[dg])
+        for dg in all_device_groups
+    }
+
+    # Build a listing of policy objects that are exclusive to each device group.
+    # This needs all of the parent device groups' policies, so is done as a second pass
+    devicegroup_exclusive_objects = {
+        dg: _collect_dg_exclusive_entries(pan_config, devicegroup_objects, dg, device_group_hierarchy_parent)
+        for dg in all_device_groups
+    }
 
     rule_limit_enabled = limit is not None
 
-    # Build a listing of policy objects that are exclusive to each device group, which won't include policies inherited from the parent device groups
-    devicegroup_exclusive_objects = {}
-    for device_group in all_device_groups:
-        devicegroup_exclusive_objects[device_group] = {}
-
-        for policy_type in pan_config.SUPPORTED_POLICY_TYPES:
-            if device_group not in device_group_hierarchy_parent:
-                # No parent means no inherited policies
-                devicegroup_exclusive_objects[device_group][policy_type] = devicegroup_objects[device_group][
-                    policy_type]
-            else:
-                parent_dg = device_group_hierarchy_parent[device_group]
-                parent_policy_uuids = set([entry.get('@uuid') for entry in devicegroup_objects[parent_dg][policy_type]])
-                exclusive_objects = [entry for entry in devicegroup_objects[device_group][policy_type] if
-                                     entry.get('@uuid') not in parent_policy_uuids]
-                devicegroup_exclusive_objects[device_group][policy_type] = exclusive_objects
-
     profilepackage = ProfilePackage(
         api_key=api_key,
         pan_config=pan_config,
@@ -105,7 +129,10 @@ def load_config_package(configuration_settings, api_key, device_group, limit, xm
 @functools.lru_cache(maxsize=None)
 def get_firewall_zone(firewall, api_key, ip):
     interface = pan_api.get_interface(firewall, api_key, ip)
-    zone = pan_api.get_interface_zone(firewall, api_key, interface)
+    # All of a firewall's interface zones are retrieved with one request and reused for every IP
+    zone = pan_api.get_interface_zones(firewall, api_key).get(interface)
+    if zone is None:
+        zone = pan_api.get_interface_zone(firewall, api_key, interface)
     return zone
 
 
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import argparse
+import concurrent.futures
 import datetime
 import logging
 import os.path
@@ -11,7 +12,8 @@ import json
 import palo_alto_firewall_analyzer.validators
 import palo_alto_firewall_analyzer.fixers
 
-from palo_alto_firewall_analyzer.core import get_policy_validators, get_policy_fixers, ConfigurationSettings
+from palo_alto_firewall_analyzer import dns_cache, pan_api
+from palo_alto_firewall_analyzer.core import get_policy_validators, get_main_process_policy_validators, get_policy_fixers, ConfigurationSettings
 from palo_alto_firewall_analyzer.pan_helpers import load_config_package, load_API_key
 
 from palo_alto_firewall_analyzer.scripts.pan_details import get_json_detail
@@ -19,6 +21,7 @@ from palo_alto_firewall_analyzer.scripts.pan_details import get_json_detail
 DEFAULT_CONFIG_DIR = os.path.expanduser("~" + os.sep + ".pan_policy_analyzer" + os.sep)
 DEFAULT_CONFIGFILE = DEFAULT_CONFIG_DIR + "PAN_CONFIG.cfg"
 DEFAULT_API_KEYFILE = DEFAULT_CONFIG_DIR + "API_KEY.txt"
+DEFAULT_DNS_CACHEFILE = DEFAULT_CONFIG_DIR + "dns_cache.sqlite"
 EXECUTION_START_TIME = datetime.datetime.today().strftime('%Y%m%d_%H%M%S')
 RUNTIME_START = time.time()
 logger = logging.getLogger('palo_alto_firewall_analyzer')
@@ -59,15 +62,59 @@ def run_policy_fixers(fixers, profilepackage, output_fname):
     return problems, total_problems
 
 
-def run_policy_validators(validators, profilepackage, output_fname):
+# Set in each worker process by _init_validator_process, so the profilepackage is only sent once per process
+_process_profilepackage = None
+
+
+def _init_validator_process(profilepackage):
+    global _process_profilepackage
+    _process_profilepackage = profilepackage
+
+
+def _run_validator_in_process(validator_function):
+    return validator_function(_process_profilepackage)
+
+
+def run_policy_validators_in_processes(validators, profilepackage, processes):
+    """Runs the validators that aren't registered as main_process_only in a pool of processes.
+    Returns a mapping of validator names to their results"""
+    main_process_validators = get_main_process_policy_validators()
+    pool_validators = {name: validator_values for name, validator_values in validators.items()
+                       if name not in main_process_validators}
+    validator_results = {}
+    # Starting the pool sends the profilepackage to every process, so skip it when there's nothing to run
+    if not pool_validators:
+        return validator_results
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=_init_validator_process,
+                                                initargs=(profilepackage,)) as executor:
+        futures = {}
+        for name, validator_values in pool_validators.items():
+            validator_name, validator_description, validator_function = validator_values
+            futures[executor.submit(_run_validator_in_process, validator_function)] = name
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            logger.info(f"Validator {name} finished")
+            validator_results[name] = future.result()
+    return validator_results
+
+
+def run_policy_validators(validators, profilepackage, output_fname, processes=1):
     problems = {}
     total_problems = 0
     total_checks = 0
     logger.info("Running validators")
 
+    if processes > 1:
+        validator_results = run_policy_validators_in_processes(validators, profilepackage, processes)
+    else:
+        validator_results = {}
+
     for name, validator_values in validators.items():
         validator_name, validator_description, validator_function = validator_values
-        validator_problems, count_checks = validator_function(profilepackage)
+        if name in validator_results:
+            validator_problems, count_checks = validator_results[name]
+        else:
+            validator_problems, count_checks = validator_function(profilepackage)
         problems[(validator_name, validator_description), count_checks] = validator_problems
         total_problems += len(validator_problems)
         total_checks += count_checks
@@ -169,14 +216,18 @@ def build_output_fname(parsed_args):
 
 
 def main():
+    # The registries are filled in when the validators and fixers are imported, so they only need to be read once
+    policy_validators = get_policy_validators()
+    policy_fixers = get_policy_fixers()
+
     description = "Checks or fixes Palo Alto Firewall issues."
     validator_listing = '\n'.join(f" * {readable_name} - {description}" for readable_name, description, f in
-                                  sorted(get_policy_validators().values()))
-    validator_epilog = f"""Here is a detailed list of the {len(get_policy_validators().keys())} supported validators:\n{validator_listing}\n"""
+                                  sorted(policy_validators.values()))
+    validator_epilog = f"""Here is a detailed list of the {len(policy_validators)} supported validators:\n{validator_listing}\n"""
 
     fixer_listing = '\n'.join(f" * {readable_name} - {description}" for readable_name, description, f in
-                              sorted(get_policy_fixers().values()))
-    fixer_epilog = f"""Here is a detailed list of the {len(get_policy_fixers().keys())} supported fixers:\n{fixer_listing}\n"""
+                              sorted(policy_fixers.values()))
+    fixer_epilog = f"""Here is a detailed list of the {len(policy_fixers)} supported fixers:\n{fixer_listing}\n"""
 
     epilog = validator_epilog + "\n\n" + fixer_epilog
     parser = argparse.ArgumentParser(description=description, epilog=epilog,
@@ -184,8 +235,8 @@ def main():
     # TODO: Make this a positional argument, where only one can be selected, and influences which of the remaining arguments are available.
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--validator", help="Only run specified validators (repeat for multiple)",
-                       choices=sorted(get_policy_validators().keys()), action='append')
-    group.add_argument("--fixer", help="Fixer to run", choices=sorted(get_policy_fixers().keys()))
+                       choices=sorted(policy_validators), action='append')
+    group.add_argument("--fixer", help="Fixer to run", choices=sorted(policy_fixers))
 
     parser.add_argument("--device-group", help="Device Group to run through validator (defaults to all)")
     parser.add_argument("--quiet", help="Silence output", action='store_true')
@@ -196,8 +247,12 @@ def main():
     parser.add_argument("--xml", help="Process an XML file from 'Export Panorama configuration version'. This skips validators that require an API key")
 
     parser.add_argument("--debug", help="Write all debug output to pan_validator_debug_YYMMDD_HHMMSS.log", action='store_true')
-    parser.add_argument("--limit", help="Limit processing to the first N rules (useful for debugging)", type=int)
+    parser.add_argument("--limit", help="Limit processing to the first N rules of each type in each device group (useful for debugging). This also applies to DisabledPolicies and DeleteDisabledPolicies", type=int)
     parser.add_argument("--output-format", help="Type File Output, default='text'", default="text", type=str, choices=['text', 'json'])
+    parser.add_argument("--dns-cache-ttl", help=f"Seconds to reuse DNS lookups cached in {DEFAULT_DNS_CACHEFILE} across runs (default is {dns_cache.DEFAULT_TTL}, 0 disables the cache)",
+                        default=dns_cache.DEFAULT_TTL, type=int)
+    parser.add_argument("--processes", help="Number of processes to run validators in (default is 1). Validators that make API requests, BadHostname, and BadHostnameUsage always run in the main process",
+                        default=1, type=int)
 
     parsed_args = parser.parse_args()
 
@@ -226,22 +281,30 @@ def main():
         logger.error("Cannot run fixers against an XML file! --fixer and --xml are mutually exclusive")
         return 1
 
+    if parsed_args.dns_cache_ttl > 0:
+        dns_cache.enable(DEFAULT_DNS_CACHEFILE, parsed_args.dns_cache_ttl)
+
     start_time = time.time()
-    profilepackage = load_config_package(configuration_settings, api_key, parsed_args.device_group,
-                                         parsed_args.limit, parsed_args.xml)
+    try:
+        profilepackage = load_config_package(configuration_settings, api_key, parsed_args.device_group,
+                                             parsed_args.limit, parsed_args.xml)
 
-    if parsed_args.fixer:
-        fixers = {parsed_args.fixer: get_policy_fixers()[parsed_args.fixer]}
-        problems, total_problems = run_policy_fixers(fixers, profilepackage, output_fname)
-    else:
-        if parsed_args.validator:
-            validators = {validator: get_policy_validators()[validator] for validator in parsed_args.validator}
+        if parsed_args.fixer:
+            fixers = {parsed_args.fixer: policy_fixers[parsed_args.fixer]}
+            problems, total_problems = run_policy_fixers(fixers, profilepackage, output_fname)
         else:
-            validators = get_policy_validators()
+            if parsed_args.validator:
+                validators = {validator: policy_validators[validator] for validator in parsed_args.validator}
+            else:
+                validators = policy_validators
 
-        problems, total_problems, total_checks = run_policy_validators(validators, profilepackage, output_fname)
+            problems, total_problems, total_checks = run_policy_validators(validators, profilepackage, output_fname,
+                                                                           parsed_args.processes)
 
-    write_analyzer_output(problems, output_fname, profilepackage, total_checks, parsed_args.output_format)
+        write_analyzer_output(problems, output_fname, profilepackage, total_checks, parsed_args.output_format)
+    finally:
+        dns_cache.save()
+        pan_api.close_session()
 
     end_time = time.time()
 
@@ -1,15 +1,22 @@
+import concurrent.futures
 import logging
+import re
 
-from palo_alto_firewall_analyzer.core import BadEntry, cached_dns_lookup, register_policy_validator, get_policy_validators
+from palo_alto_firewall_analyzer.core import BadEntry, cached_dns_lookup, get_entry_columns, register_policy_validator, get_policy_validators
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
 logger = logging.getLogger(__name__)
 
-@register_policy_validator("BadHostname", "Address contains a hostname that doesn't resolve")
+DNS_LOOKUP_THREADS = 64
+
+# BadHostnameUsage runs BadHostname itself, so both stay in the main process to share cached_dns_lookup's cache
+@register_policy_validator("BadHostname", "Address contains a hostname that doesn't resolve", main_process_only=True)
 def find_badhostname(profilepackage):
     device_groups = profilepackage.device_groups
     devicegroup_objects = profilepackage.devicegroup_objects
     ignored_dns_prefixes = tuple([prefix.lower() for prefix in profilepackage.settings.get('Ignored DNS Prefixes','').split(',')])
+    # Matches FQDNs starting with any of the ignored prefixes
+    ignored_dns_prefixes_regex = re.compile("^(?:" + "|".join(re.escape(ignored_prefix) for ignored_prefix in ignored_dns_prefixes) + ")")
  
     badentries = []
     count_checks = 0
@@ -17,17 +24,31 @@ def find_badhostname(profilepackage):
     logger.info("*" * 80)
     logger.info("Checking for non-resolving hostnames")
 
+    # DNS lookups are slow, so first collect every FQDN that needs to be resolved and resolve them concurrently
+    fqdns_to_resolve = {}
+    for device_group in device_groups:
+        addresses = get_entry_columns(devicegroup_objects[device_group], 'Addresses')
+        for fqdns in addresses['fqdn']:
+            for fqdn_text in fqdns:
+                fqdn_text = fqdn_text.lower()
+                if ignored_dns_prefixes_regex.match(fqdn_text):
+                    continue
+                fqdns_to_resolve[fqdn_text] = None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DNS_LOOKUP_THREADS) as executor:
+        fqdns_to_ips = dict(zip(fqdns_to_resolve, executor.map(cached_dns_lookup, fqdns_to_resolve)))
+
     bad_address_objects = set()
     for i, device_group in enumerate(device_groups):
         logger.info(f"({i + 1}/{len(device_groups)}) Checking {device_group}'s Addresses")
-        for entry in devicegroup_objects[device_group]['Addresses']:
-            entry_name = entry.get('name')
-            for fqdn_node in entry.findall('fqdn'):
+        addresses = get_entry_columns(devicegroup_objects[device_group], 'Addresses')
+        for entry_name, fqdns, entry in zip(addresses['name'], addresses['fqdn'], addresses['xml_ref']):
+            for fqdn_text in fqdns:
                 count_checks+=1
-                fqdn_text = fqdn_node.text.lower()
-                if any(fqdn_text.startswith(ignored_prefix) for ignored_prefix in ignored_dns_prefixes):
+                fqdn_text = fqdn_text.lower()
+                # Ignored FQDNs were never resolved
+                if fqdn_text not in fqdns_to_ips:
                     continue
-                ip = cached_dns_lookup(fqdn_text)
+                ip = fqdns_to_ips[fqdn_text]
                 if ip is None:
                     bad_address_objects.add(entry_name)                    
                     text = f"Device Group {device_group}'s address '{entry_name}' uses the following FQDN which doesn't resolve: '{fqdn_text}'"
@@ -42,7 +63,7 @@ def find_badhostname(profilepackage):
                 
     return badentries,count_checks
 
-@register_policy_validator("BadHostnameUsage", "AddressGroups and Security Rules using Address objects which don't resolve")
+@register_policy_validator("BadHostnameUsage", "AddressGroups and Security Rules using Address objects which don't resolve", main_process_only=True)
 def find_badhostnameusage(profilepackage):
     device_groups = profilepackage.device_groups
     devicegroup_objects = profilepackage.devicegroup_objects
@@ -51,23 +72,18 @@ def find_badhostnameusage(profilepackage):
     _, _, validator_function = get_policy_validators()['BadHostname']
 
     bad_hostname_results,count_checks = validator_function(profilepackage)
-    bad_address_objects = set()
-    for entry in bad_hostname_results:
-        bad_address_objects.add(entry.data.get('name'))
-        
+    bad_address_objects = frozenset(entry.data.get('name') for entry in bad_hostname_results)
     
     badentries = []
     for i, device_group in enumerate(device_groups):
         logger.info(f"({i + 1}/{len(device_groups)}) Checking {device_group}'s Address Groups")
-        for entry in devicegroup_objects[device_group]['AddressGroups']:
+        address_groups = get_entry_columns(devicegroup_objects[device_group], 'AddressGroups')
+        for entry_name, address_group_members, entry in zip(address_groups['name'], address_groups['members'], address_groups['xml_ref']):
             count_checks+=1
-            address_group_members = []
-            for ag_member in entry.findall('./static/member'):
-                address_group_members.append(ag_member.text)
-            bad_members = bad_address_objects & set(address_group_members)
+            bad_members = bad_address_objects.intersection(address_group_members)
             if bad_members:
                 count_checks+=1
-                text = f"Device Group {device_group}'s Address Group '{entry.get('name')}' uses the following address objects which don't resolve: {sorted(bad_members)}"
+                text = f"Device Group {device_group}'s Address Group '{entry_name}' uses the following address objects which don't resolve: {sorted(bad_members)}"
                 detail={
                     "device_group":device_group,
                     "entry_type":'AddressGroups', 
@@ -79,21 +95,18 @@ def find_badhostnameusage(profilepackage):
 
     for i, device_group in enumerate(device_groups):
         for ruletype in ('SecurityPreRules', 'SecurityPostRules'):
-            rules = devicegroup_exclusive_objects[device_group][ruletype]
+            rules = get_entry_columns(devicegroup_exclusive_objects[device_group], ruletype)
             logger.info(f"({i + 1}/{len(device_groups)}) Checking {device_group}'s {ruletype}")
 
-            for entry in rules:
+            for rule_name, source_members, dest_members, disabled, entry in zip(
+                    rules['name'], rules['source_members'], rules['dest_members'], rules['disabled'], rules['xml_ref']):
                 # Disabled rules can be ignored
-                if entry.find("./disabled") is not None and entry.find("./disabled").text == "yes":
+                if disabled:
                     continue
 
-                rule_name = entry.get('name')
-                source_members = set([sm.text for sm in entry.findall('./source/member')])
-                dest_members = set([dm.text for dm in entry.findall('./destination/member')])
-
                 for members, direction in [(source_members, 'Source'), (dest_members, 'Dest')]:
                     count_checks+=1
-                    bad_members = bad_address_objects & members
+                    bad_members = bad_address_objects.intersection(members)
                     if bad_members:
                         text = f"Device Group {device_group}'s {ruletype} '{rule_name}' {direction} contain the following address objects which don't resolve: {sorted(bad_members)}"
                         detail={
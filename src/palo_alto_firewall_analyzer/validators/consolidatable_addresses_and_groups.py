@@ -28,14 +28,17 @@ def find_replacement_objects(pan_config, devicegroup_objects, device_group, obje
     # the code much cleaner and anyways shouldn't take too long, compared to
     # the API calls it will help save
     addresses_to_counts = collections.Counter()
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+    get_dg_pol = pan_config.get_devicegroup_policy
+    get_dg_obj = pan_config.get_devicegroup_object
     for child_dg in devicegroup_objects[device_group]['all_child_device_groups']:
         # First check all child Address Groups
-        for addressgroup in pan_config.get_devicegroup_object('AddressGroups', child_dg):
+        for addressgroup in get_dg_obj('AddressGroups', child_dg):
             for member_element in addressgroup.findall('./static/member'):
                 addresses_to_counts[member_element.text] += 1
         # Then check all of the policies
-        for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-            for policy_entry in pan_config.get_devicegroup_policy(policytype, child_dg):
+        for policytype in policy_types:
+            for policy_entry in get_dg_pol(policytype, child_dg):
                 for member in policy_entry.findall('./*/member'):
                     addresses_to_counts[member.text] += 1
 
@@ -53,20 +56,23 @@ def find_objects_policies_needing_replacement(pan_config, devicegroup_objects, d
     addressgroups_needing_replacement = []
     policies_needing_replacement = []
 
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+    get_dg_pol = pan_config.get_devicegroup_policy
+    get_dg_obj = pan_config.get_devicegroup_object
+    xml_paths = ['./*/member',
+                 './*/dynamic-ip-and-port/translated-address/member',
+                 './*/translated-address',
+                 './*/static-ip/translated-address']
     for child_dg in devicegroup_objects[device_group]['all_child_device_groups']:
         # First check all child Address Groups
-        for addressgroup in pan_config.get_devicegroup_object('AddressGroups', child_dg):
+        for addressgroup in get_dg_obj('AddressGroups', child_dg):
             for member_element in addressgroup.findall('./static/member'):
                 if member_element.text in addresses_to_replace:
                     addressgroups_needing_replacement += [(child_dg, 'AddressGroups', addressgroup)]
                     break
         # Then check all of the policy's referenced members
-        xml_paths = ['./*/member',
-                     './*/dynamic-ip-and-port/translated-address/member',
-                     './*/translated-address',
-                     './*/static-ip/translated-address']
-        for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-            for policy_entry in pan_config.get_devicegroup_policy(policytype, child_dg):
+        for policytype in policy_types:
+            for policy_entry in get_dg_pol(policytype, child_dg):
                 # Skip disabled policies
                 if policy_entry.find('disabled') is not None and policy_entry.find('disabled').text == 'yes':
                     continue
@@ -27,14 +27,17 @@ def find_replacement_objects(pan_config, devicegroup_objects, device_group, obje
     # the code much cleaner and anyways shouldn't take too long, compared to
     # the API calls it will help save
     services_to_counts = collections.Counter()
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+    get_dg_pol = pan_config.get_devicegroup_policy
+    get_dg_obj = pan_config.get_devicegroup_object
     for child_dg in devicegroup_objects[device_group]['all_child_device_groups']:
         # First check all child Services Groups
-        for servicegroup in pan_config.get_devicegroup_object('ServiceGroups', child_dg):
+        for servicegroup in get_dg_obj('ServiceGroups', child_dg):
             for member_element in servicegroup.findall('./members/member'):
                 services_to_counts[member_element.text] += 1
         # Then check all of the policies
-        for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-            for policy_entry in pan_config.get_devicegroup_policy(policytype, child_dg):
+        for policytype in policy_types:
+            for policy_entry in get_dg_pol(policytype, child_dg):
                 if policytype in ("NATPreRules", "NATPostRules"):
                     for service_element in policy_entry.findall('./service'):
                         services_to_counts[service_element.text] += 1
@@ -56,16 +59,19 @@ def find_objects_policies_needing_replacement(pan_config, devicegroup_objects, d
     servicegroups_needing_replacement = []
     policies_needing_replacement = []
 
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+    get_dg_pol = pan_config.get_devicegroup_policy
+    get_dg_obj = pan_config.get_devicegroup_object
     for child_dg in devicegroup_objects[device_group]['all_child_device_groups']:
         # First check all child Services Groups
-        for servicegroup in pan_config.get_devicegroup_object('ServiceGroups', child_dg):
+        for servicegroup in get_dg_obj('ServiceGroups', child_dg):
             for member_element in servicegroup.findall('./members/member'):
                 if member_element.text in services_to_replace:
                     servicegroups_needing_replacement += [(child_dg, 'ServiceGroups', servicegroup)]
                     break
         # Then check all of the policies
-        for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-            for policy_entry in pan_config.get_devicegroup_policy(policytype, child_dg):
+        for policytype in policy_types:
+            for policy_entry in get_dg_pol(policytype, child_dg):
                 # Skip disabled policies
                 if policy_entry.find('disabled') is not None and policy_entry.find('disabled').text == 'yes':
                     continue
@@ -1,6 +1,7 @@
+import itertools
 import logging
 
-from palo_alto_firewall_analyzer.core import BadEntry, register_policy_validator
+from palo_alto_firewall_analyzer.core import BadEntry, get_entry_columns, register_policy_validator
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
 logger = logging.getLogger(__name__)
@@ -9,31 +10,33 @@ logger = logging.getLogger(__name__)
 @register_policy_validator("DisabledPolicies", "Policy objects that are disabled")
 def find_disabled_policies(profilepackage):
     device_groups = profilepackage.device_groups
+    devicegroup_objects = profilepackage.devicegroup_objects
     pan_config = profilepackage.pan_config
     ignored_disabled_rules = set(profilepackage.settings.get('Ignored Disabled Policies', "").split(','))
 
     policies_to_delete = []
     count_policies = 0
-    
+
+    policy_types = pan_config.SUPPORTED_POLICY_TYPES
+
     for device_group in device_groups:
-        for policy_type in pan_config.SUPPORTED_POLICY_TYPES:
-            policies = pan_config.get_devicegroup_policy(policy_type, device_group)
-            
-            for policy_entry in policies:                
-                disabled = (policy_entry.find('disabled') is not None and policy_entry.find('disabled').text == 'yes')
-                if disabled:
-                    policy_name = policy_entry.get('name')
-                    if policy_name in ignored_disabled_rules:            
-                        continue
-                    text = f"Device Group {device_group}'s {policy_type} \"{policy_name}\" is disabled"
-                    detail = {
-                        "policy_type":policy_type, 
-                        "policy_name":policy_name,
-                        "device_group":device_group,
-                        "entry_type":policy_type
-                        }
-                    policy_to_delete = BadEntry(data=[policy_entry], text=text, device_group=device_group, entry_type=policy_type, Detail=parsed_details(detail))
-                    policies_to_delete.append(policy_to_delete)
-                count_policies+=1
-                
+        dgo = devicegroup_objects[device_group]
+        for policy_type in policy_types:
+            rules = get_entry_columns(dgo, policy_type)
+            disabled_rules = list(itertools.compress(zip(rules['name'], rules['xml_ref']), rules['disabled']))
+            reported_rules = [(policy_name, policy_entry) for policy_name, policy_entry in disabled_rules
+                              if policy_name not in ignored_disabled_rules]
+            # Ignored disabled rules aren't counted as checked
+            count_policies += len(rules['xml_ref']) - (len(disabled_rules) - len(reported_rules))
+            for policy_name, policy_entry in reported_rules:
+                text = f"Device Group {device_group}'s {policy_type} \"{policy_name}\" is disabled"
+                detail = {
+                    "policy_type":policy_type, 
+                    "policy_name":policy_name,
+                    "device_group":device_group,
+                    "entry_type":policy_type
+                    }
+                policy_to_delete = BadEntry(data=[policy_entry], text=text, device_group=device_group, entry_type=policy_type, Detail=parsed_details(detail))
+                policies_to_delete.append(policy_to_delete)
+
     return policies_to_delete, count_policies
@@ -6,7 +6,7 @@ import xml.etree.ElementTree
 
 import xmltodict
 
-from palo_alto_firewall_analyzer.core import BadEntry, register_policy_validator
+from palo_alto_firewall_analyzer.core import BadEntry, get_entries_by_name, register_policy_validator
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
 logger = logging.getLogger(__name__)
@@ -41,7 +41,7 @@ def find_shadowing_objects(profilepackage, object_type):
 
     for i, device_group in enumerate(device_groups):
         logger.info(f"({i + 1}/{len(device_groups)}) Checking {device_group}'s address objects")
-        names_to_obj = {entry.get('name'): entry for entry in devicegroup_objects[device_group][object_type]}
+        names_to_obj = get_entries_by_name(devicegroup_objects[device_group], object_type)
 
         # An object can be inherited from any parent device group. Need to check all of them.
         names_to_dg_obj_from_parent_dgs = collections.defaultdict(list)
@@ -1,6 +1,7 @@
+import itertools
 import logging
 
-from palo_alto_firewall_analyzer.core import BadEntry, register_policy_validator
+from palo_alto_firewall_analyzer.core import BadEntry, get_entries_by_name, get_entry_columns, register_policy_validator
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
 logger = logging.getLogger(__name__)
@@ -19,26 +20,23 @@ def find_unused_addresses(profilepackage):
 
     for i, device_group in enumerate(device_groups):
         logger.info (f"({i+1}/{len(device_groups)}) Checking {device_group}'s address objects")
-        addresses = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['Addresses']}
+        addresses = get_entries_by_name(devicegroup_objects[device_group], 'Addresses')
 
         # An address or group can be used by any child device group's Address group or policy. Need to check all of them.
         addresses_and_groups_in_use = set()
         child_dgs = devicegroup_objects[device_group]['all_child_device_groups']
         for child_dg in child_dgs:
             # First check all child Address Groups
-            for address_group in devicegroup_objects[child_dg]['AddressGroups']:
-                for address_group_elem in address_group.findall('./static/member'):
-                    addresses_and_groups_in_use.add(address_group_elem.text)
+            address_groups = get_entry_columns(devicegroup_objects[child_dg], 'AddressGroups')
+            addresses_and_groups_in_use.update(itertools.chain.from_iterable(address_groups['members']))
             # Then check all of the policies. As a note, policies use a mix of addresses and address groups
             for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-                policies = devicegroup_objects[child_dg][policytype]
-                for policy_entry in policies:
-                    for src_elem in policy_entry.findall('./source/member'):
-                        addresses_and_groups_in_use.add (src_elem.text)
-                    for dest_elem in policy_entry.findall('./destination/member'):
-                        addresses_and_groups_in_use.add(dest_elem.text)
-                    # Special fields only in NAT policies:
-                    if policytype in ("NATPreRules", "NATPostRules"):
+                rules = get_entry_columns(devicegroup_objects[child_dg], policytype)
+                addresses_and_groups_in_use.update(itertools.chain.from_iterable(rules['source_members']))
+                addresses_and_groups_in_use.update(itertools.chain.from_iterable(rules['dest_members']))
+                # Special fields only in NAT policies:
+                if policytype in ("NATPreRules", "NATPostRules"):
+                    for policy_entry in devicegroup_objects[child_dg][policytype]:
                         for src_elem in policy_entry.findall('./source-translation/translated-address'):
                             addresses_and_groups_in_use.add(src_elem.text)
                         for src_elem in policy_entry.findall('./source-translation/dynamic-ip-and-port/translated-address/member'):
@@ -81,26 +79,23 @@ def find_unused_addressgroups(profilepackage):
 
     for i, device_group in enumerate(device_groups):
         logger.info (f"({i+1}/{len(device_groups)}) Checking {device_group}'s Address Group objects")
-        addressgroups = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['AddressGroups']}
+        addressgroups = get_entries_by_name(devicegroup_objects[device_group], 'AddressGroups')
 
         # An address or group can be used by any child device group's Address group or policy. Need to check all of them.
         addresses_and_groups_in_use = set()
         child_dgs = devicegroup_objects[device_group]['all_child_device_groups']
         for child_dg in child_dgs:
             # First check all child Address Groups
-            for address_group in devicegroup_objects[child_dg]['AddressGroups']:
-                for address_group_elem in address_group.findall('./static/member'):
-                    addresses_and_groups_in_use.add(address_group_elem.text)
+            address_groups = get_entry_columns(devicegroup_objects[child_dg], 'AddressGroups')
+            addresses_and_groups_in_use.update(itertools.chain.from_iterable(address_groups['members']))
             # Then check all of the policies. As a note, policies use a mix of addresses and address groups
             for policytype in pan_config.SUPPORTED_POLICY_TYPES:
-                policies = devicegroup_objects[child_dg][policytype]
-                for policy_entry in policies:
-                    for src_elem in policy_entry.findall('./source/member'):
-                        addresses_and_groups_in_use.add (src_elem.text)
-                    for dest_elem in policy_entry.findall('./destination/member'):
-                        addresses_and_groups_in_use.add(dest_elem.text)
-                    # Special fields only in NAT policies:
-                    if policytype in ("NATPreRules", "NATPostRules"):
+                rules = get_entry_columns(devicegroup_objects[child_dg], policytype)
+                addresses_and_groups_in_use.update(itertools.chain.from_iterable(rules['source_members']))
+                addresses_and_groups_in_use.update(itertools.chain.from_iterable(rules['dest_members']))
+                # Special fields only in NAT policies:
+                if policytype in ("NATPreRules", "NATPostRules"):
+                    for policy_entry in devicegroup_objects[child_dg][policytype]:
                         for src_elem in policy_entry.findall('./source-translation/translated-address'):
                             addresses_and_groups_in_use.add(src_elem.text)
                         for src_elem in policy_entry.findall('./source-translation/dynamic-ip-and-port/translated-address/member'):
@@ -1,6 +1,6 @@
 import logging
 
-from palo_alto_firewall_analyzer.core import BadEntry, register_policy_validator
+from palo_alto_firewall_analyzer.core import BadEntry, get_entries_by_name, register_policy_validator
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
 logger = logging.getLogger(__name__)
@@ -24,7 +24,7 @@ def find_unused_service_like_object(profilepackage, object_type, object_friendly
 
     for i, device_group in enumerate(device_groups):
         logger.info(f"({i + 1}/{len(device_groups)}) Checking {device_group}'s {object_friendly_type} objects")
-        services = {entry.get('name'): entry for entry in devicegroup_objects[device_group][object_type]}
+        services = get_entries_by_name(devicegroup_objects[device_group], object_type)
 
         # A Services object can be used by any child device group's Services Group or Policy. Need to check all of them.
         services_in_use = set()
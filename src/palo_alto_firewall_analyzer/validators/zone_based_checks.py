@@ -2,7 +2,7 @@ import collections
 import ipaddress
 import logging
 
-from palo_alto_firewall_analyzer.core import BadEntry, get_single_ip_from_address, register_policy_validator, xml_object_to_dict
+from palo_alto_firewall_analyzer.core import BadEntry, get_entries_by_name, get_single_ip_from_address, register_policy_validator, xml_object_to_dict
 from palo_alto_firewall_analyzer.pan_helpers import get_firewall_zone
 from palo_alto_firewall_analyzer.scripts.pan_details import parsed_details
 
@@ -89,7 +89,7 @@ def get_zone_for_source_member(firewall, api_key, member_name, address_groups, a
         return [], False
 
 
-@register_policy_validator("MissingZones", "Rule is missing a Zone!")
+@register_policy_validator("MissingZones", "Rule is missing a Zone!", main_process_only=True)
 def find_missing_zones(profilepackage):
     device_groups = profilepackage.device_groups
     devicegroup_objects = profilepackage.devicegroup_objects
@@ -107,8 +107,8 @@ def find_missing_zones(profilepackage):
     for i, device_group in enumerate(device_groups):
         firewalls = devicegroup_objects[device_group]['all_active_child_firewalls']
 
-        addresses = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['Addresses']}
-        address_groups = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['AddressGroups']}
+        addresses = dict(get_entries_by_name(devicegroup_objects[device_group], 'Addresses'))
+        address_groups = dict(get_entries_by_name(devicegroup_objects[device_group], 'AddressGroups'))
 
         # Address and Address Group objects can be inherited from parent device groups, so we need data from them too
         parent_dgs = []
@@ -175,7 +175,7 @@ def find_missing_zones(profilepackage):
                         badentries.append(BadEntry(data=entry, text=text, device_group=device_group, entry_type=ruletype,Detail=parsed_details(detail)))
     return badentries,count_checks
 
-@register_policy_validator("ExtraZones", "Rule has an extra Zone!")
+@register_policy_validator("ExtraZones", "Rule has an extra Zone!", main_process_only=True)
 def find_extra_zones(profilepackage):
     device_groups = profilepackage.device_groups
     devicegroup_objects = profilepackage.devicegroup_objects
@@ -195,8 +195,8 @@ def find_extra_zones(profilepackage):
     for i, device_group in enumerate(device_groups):
         firewalls = devicegroup_objects[device_group]['all_active_child_firewalls']
 
-        addresses = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['Addresses']}
-        address_groups = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['AddressGroups']}
+        addresses = dict(get_entries_by_name(devicegroup_objects[device_group], 'Addresses'))
+        address_groups = dict(get_entries_by_name(devicegroup_objects[device_group], 'AddressGroups'))
 
         # Address and Address Group objects can be inherited from parent device groups, so we need data from them too
         parent_dgs = []
@@ -269,7 +269,7 @@ def find_extra_zones(profilepackage):
                         badentries.append( BadEntry(data=entry, text=text, device_group=device_group, entry_type=ruletype,Detail=parsed_details(detail)))
     return badentries, count_checks
 
-@register_policy_validator("ExtraRules", "Rule has a single Source/Dest Zone! Rule is not needed!")
+@register_policy_validator("ExtraRules", "Rule has a single Source/Dest Zone! Rule is not needed!", main_process_only=True)
 def find_extra_rules(profilepackage):
     device_groups = profilepackage.device_groups
     devicegroup_objects = profilepackage.devicegroup_objects
@@ -289,8 +289,8 @@ def find_extra_rules(profilepackage):
     for i, device_group in enumerate(device_groups):
         firewalls = devicegroup_objects[device_group]['all_active_child_firewalls']
 
-        addresses = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['Addresses']}
-        address_groups = {entry.get('name'):entry for entry in devicegroup_objects[device_group]['AddressGroups']}
+        addresses = dict(get_entries_by_name(devicegroup_objects[device_group], 'Addresses'))
+        address_groups = dict(get_entries_by_name(devicegroup_objects[device_group], 'AddressGroups'))
 
         # Address and Address Group objects can be inherited from parent device groups, so we need data from them too
         parent_dgs = []
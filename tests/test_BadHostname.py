@@ -32,6 +32,11 @@ class TestBadHostname(unittest.TestCase):
         )
         return profilepackage
 
+    @staticmethod
+    def fake_dns_lookup(fqdn):
+        # Lookups run concurrently, so resolve based on the FQDN rather than the call order
+        return {'valid.tld': '127.0.0.1'}.get(fqdn)
+
     @patch('palo_alto_firewall_analyzer.validators.bad_hostnames.cached_dns_lookup')
     def test_badhostname(self, mocked_dns_lookup):
         test_xml = """\
@@ -61,7 +66,7 @@ class TestBadHostname(unittest.TestCase):
         address_groups = pan_config.get_devicegroup_object('AddressGroups', 'shared')
         rules = pan_config.get_devicegroup_policy('SecurityPreRules', 'shared')
         ignored_dns_prefixes = ["ignored"]
-        mocked_dns_lookup.side_effect = ['127.0.0.1', None]
+        mocked_dns_lookup.side_effect = self.fake_dns_lookup
         profilepackage = self.create_profilepackage(addresses, address_groups, rules, ignored_dns_prefixes)
 
         _, _, validator_function = get_policy_validators()['BadHostname']
@@ -69,6 +74,8 @@ class TestBadHostname(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(count_checks, 3)
         self.assertEqual(results[0].data.get('name'), 'invalid_fqdn')
+        # Each non-ignored FQDN is only resolved once
+        self.assertEqual(mocked_dns_lookup.call_count, 2)
 
 
     @patch('palo_alto_firewall_analyzer.validators.bad_hostnames.cached_dns_lookup')
@@ -100,7 +107,7 @@ class TestBadHostname(unittest.TestCase):
         address_groups = pan_config.get_devicegroup_object('AddressGroups', 'shared')
         rules = pan_config.get_devicegroup_policy('SecurityPreRules', 'shared')
         ignored_dns_prefixes = ["ignored"]
-        mocked_dns_lookup.side_effect = ['127.0.0.1', None]
+        mocked_dns_lookup.side_effect = self.fake_dns_lookup
         profilepackage = self.create_profilepackage(addresses, address_groups, rules, ignored_dns_prefixes)
 
         _, _, validator_function = get_policy_validators()['BadHostnameUsage']
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from palo_alto_firewall_analyzer.dns_cache import DNSCache
+
+
+class TestDNSCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, 'dns_cache.sqlite')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_entries_persist(self):
+        dns_cache = DNSCache(self.path)
+        dns_cache.load()
+        self.assertEqual(dns_cache.get('valid.tld'), (False, None))
+        dns_cache.put('valid.tld', '127.0.0.1')
+        dns_cache.put('invalid.tld', None)
+        dns_cache.save()
+
+        reloaded_cache = DNSCache(self.path)
+        reloaded_cache.load()
+        self.assertEqual(reloaded_cache.get('valid.tld'), (True, '127.0.0.1'))
+        self.assertEqual(reloaded_cache.get('invalid.tld'), (True, None))
+
+    def test_expired_entries_ignored(self):
+        dns_cache = DNSCache(self.path, ttl=3600, negative_ttl=300)
+        dns_cache.load()
+        now = int(time.time())
+        with sqlite3.connect(self.path) as conn:
+            conn.executemany("INSERT INTO dns_cache (fqdn, ip, resolved_at) VALUES (?, ?, ?)",
+                             [('recent.tld', '127.0.0.1', now - 60),
+                              ('expired.tld', '127.0.0.2', now - 7200),
+                              ('recent_invalid.tld', None, now - 60),
+                              ('expired_invalid.tld', None, now - 600)])
+        conn.close()
+
+        dns_cache.load()
+        self.assertEqual(dns_cache.get('recent.tld'), (True, '127.0.0.1'))
+        self.assertEqual(dns_cache.get('expired.tld'), (False, None))
+        self.assertEqual(dns_cache.get('recent_invalid.tld'), (True, None))
+        self.assertEqual(dns_cache.get('expired_invalid.tld'), (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+import collections
+import unittest
+
+from palo_alto_firewall_analyzer.core import get_policy_validators
+from palo_alto_firewall_analyzer.core import ProfilePackage, ConfigurationSettings
+from palo_alto_firewall_analyzer.pan_config import PanConfig
+
+
+class TestDisabledPolicies(unittest.TestCase):
+    @staticmethod
+    def create_profilepackage(pan_config, ignored_disabled_policies):
+        device_groups = ["shared", "test_dg"]
+        devicegroup_objects = {}
+        for device_group in device_groups:
+            devicegroup_objects[device_group] = collections.defaultdict(list)
+            for policy_type in pan_config.SUPPORTED_POLICY_TYPES:
+                devicegroup_objects[device_group][policy_type] = pan_config.get_devicegroup_policy(policy_type, device_group)
+        settings = ConfigurationSettings().get_config()
+        settings['Ignored Disabled Policies'] = ",".join(ignored_disabled_policies)
+
+        profilepackage = ProfilePackage(
+            api_key='',
+            pan_config=pan_config,
+            settings=settings,
+            device_group_hierarchy_children={},
+            device_group_hierarchy_parent={},
+            device_groups_and_firewalls={},
+            device_groups=device_groups,
+            devicegroup_objects=devicegroup_objects,
+            devicegroup_exclusive_objects={},
+            rule_limit_enabled=False
+        )
+        return profilepackage
+
+    def test_disabled_policies(self):
+        test_xml = """\
+        <response status="success"><result><config>
+          <shared>
+            <pre-rulebase><security><rules>
+              <entry name="enabled_rule"></entry>
+              <entry name="disabled_rule"><disabled>yes</disabled></entry>
+            </rules></security></pre-rulebase>
+          </shared>
+          <devices><entry><device-group><entry name="test_dg">
+            <pre-rulebase><security><rules>
+              <entry name="explicitly_enabled_rule"><disabled>no</disabled></entry>
+              <entry name="ignored_disabled_rule"><disabled>yes</disabled></entry>
+            </rules></security></pre-rulebase>
+            <post-rulebase><nat><rules>
+              <entry name="disabled_nat_rule"><disabled>yes</disabled></entry>
+            </rules></nat></post-rulebase>
+          </entry></device-group></entry></devices>
+        </config></result></response>
+        """
+        pan_config = PanConfig(test_xml)
+        profilepackage = self.create_profilepackage(pan_config, ["ignored_disabled_rule"])
+
+        _, _, validator_function = get_policy_validators()['DisabledPolicies']
+        results, count_checks = validator_function(profilepackage)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(count_checks, 4)
+        self.assertEqual(results[0].data[0].get('name'), 'disabled_rule')
+        self.assertEqual(results[0].device_group, 'shared')
+        self.assertEqual(results[0].entry_type, 'SecurityPreRules')
+        self.assertEqual(results[1].data[0].get('name'), 'disabled_nat_rule')
+        self.assertEqual(results[1].device_group, 'test_dg')
+        self.assertEqual(results[1].entry_type, 'NATPostRules')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+import unittest
+from unittest.mock import patch, MagicMock
+
+from palo_alto_firewall_analyzer import pan_api
+from palo_alto_firewall_analyzer.pan_helpers import get_firewall_zone
+
+
+class TestGetFirewallZone(unittest.TestCase):
+    def tearDown(self):
+        pan_api.get_interface_zones.cache_clear()
+        get_firewall_zone.cache_clear()
+
+    @patch('palo_alto_firewall_analyzer.pan_api.get_interface_zone')
+    @patch('palo_alto_firewall_analyzer.pan_api.get_interface')
+    @patch('palo_alto_firewall_analyzer.pan_api.pan_api')
+    def test_get_firewall_zone(self, mocked_pan_api, mocked_get_interface, mocked_get_interface_zone):
+        mocked_pan_api.return_value = MagicMock(text="""\
+        <response status="success"><result><ifnet>
+          <entry><name>ethernet1/1</name><zone>trust</zone></entry>
+          <entry><name>ethernet1/2</name><zone>untrust</zone></entry>
+          <entry><name>ethernet1/3</name><zone/></entry>
+        </ifnet></result></response>
+        """)
+        mocked_get_interface.side_effect = lambda firewall, api_key, ip: {'10.0.0.1': 'ethernet1/1', '10.0.0.2': 'ethernet1/2', '10.0.0.3': 'ethernet1/3'}[ip]
+        mocked_get_interface_zone.return_value = 'fallback'
+
+        self.assertEqual(get_firewall_zone('fw', 'key', '10.0.0.1'), 'trust')
+        self.assertEqual(get_firewall_zone('fw', 'key', '10.0.0.2'), 'untrust')
+        self.assertEqual(get_firewall_zone('fw', 'key', '10.0.0.3'), 'fallback')
+        # The interface zones are only requested once per firewall
+        self.assertEqual(mocked_pan_api.call_count, 1)
+        mocked_get_interface_zone.assert_called_once_with('fw', 'key', 'ethernet1/3')
+
+
+if __name__ == "__main__":
+    unittest.main()
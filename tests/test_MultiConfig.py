@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+import unittest
+from unittest.mock import patch, MagicMock
+
+from palo_alto_firewall_analyzer import pan_api
+from palo_alto_firewall_analyzer.core import xml_object_to_dict, dict_to_xml_entry
+from palo_alto_firewall_analyzer.pan_config import PanConfig
+
+
+class TestMultiConfig(unittest.TestCase):
+    test_xml = """\
+    <response status="success"><result><config>
+      <shared>
+        <address-group>
+          <entry name="shared_group" uuid="1111-aaaa"><static><member>a&amp;b</member><member>c&lt;d</member></static></entry>
+        </address-group>
+      </shared>
+      <devices><entry><device-group><entry name="test_dg">
+        <pre-rulebase><security><rules>
+          <entry name="dg_rule" uuid="2222-bbbb"><source><member>src</member></source><destination><member>dst</member></destination></entry>
+        </rules></security></pre-rulebase>
+      </entry></device-group></entry></devices>
+    </config></result></response>
+    """
+
+    @classmethod
+    def build_operations(cls):
+        # Built the same way as the consolidation fixer does
+        pan_config = PanConfig(cls.test_xml)
+        entries = [
+            ('AddressGroups', 'shared', pan_config.get_devicegroup_object('AddressGroups', 'shared')[0]),
+            ('SecurityPreRules', 'test_dg', pan_config.get_devicegroup_policy('SecurityPreRules', 'test_dg')[0]),
+        ]
+        operations = []
+        for entry_type, device_group, entry in entries:
+            entry_dict = xml_object_to_dict(entry)['entry']
+            xpath = pan_config.get_api_xpath(entry_type, device_group, entry_dict['@name'])
+            operations.append(('edit', xpath, dict_to_xml_entry(entry_dict)))
+        return operations
+
+    @patch('palo_alto_firewall_analyzer.pan_api.pan_api')
+    def test_multi_config(self, mocked_pan_api):
+        mocked_pan_api.return_value = MagicMock(text='<response status="success" code="20"><msg>command succeeded</msg></response>')
+
+        pan_api.multi_config('panorama', 'key', self.build_operations())
+
+        expected_element = (
+            '<multi-configure-request>'
+            '<edit id="1" xpath="/config/shared/address-group/entry[@name=\'shared_group\']">'
+            '<entry name="shared_group" uuid="1111-aaaa"><static><member>a&amp;b</member><member>c&lt;d</member></static></entry>'
+            '</edit>'
+            '<edit id="2" xpath="/config/devices/entry[@name=\'localhost.localdomain\']/device-group/entry[@name=\'test_dg\']/pre-rulebase/security/rules/entry[@name=\'dg_rule\']">'
+            '<entry name="dg_rule" uuid="2222-bbbb"><source><member>src</member></source><destination><member>dst</member></destination></entry>'
+            '</edit>'
+            '</multi-configure-request>'
+        )
+        mocked_pan_api.assert_called_once_with(
+            'panorama', method='post', path='/api',
+            params={'type': 'config', 'action': 'multi-config', 'strict-transactional': 'yes'},
+            data={'element': expected_element}, api_key='key')
+
+    @patch('palo_alto_firewall_analyzer.pan_api.pan_api')
+    def test_multi_config_failure(self, mocked_pan_api):
+        mocked_pan_api.return_value = MagicMock(text='<response status="error" code="12"><msg>Invalid object</msg></response>')
+
+        with self.assertRaises(Exception):
+            pan_api.multi_config('panorama', 'key', self.build_operations())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+import collections
+import unittest
+from unittest.mock import patch
+
+from palo_alto_firewall_analyzer.core import get_policy_validators
+from palo_alto_firewall_analyzer.core import ProfilePackage, ConfigurationSettings
+from palo_alto_firewall_analyzer.pan_config import PanConfig
+from palo_alto_firewall_analyzer.scripts.pan_analyzer import run_policy_validators
+
+
+class TestRunPolicyValidators(unittest.TestCase):
+    @staticmethod
+    def create_profilepackage(pan_config):
+        device_groups = ["shared"]
+        devicegroup_objects = {"shared": collections.defaultdict(list)}
+        devicegroup_objects["shared"]['Addresses'] = pan_config.get_devicegroup_object('Addresses', 'shared')
+        devicegroup_objects["shared"]['SecurityPreRules'] = pan_config.get_devicegroup_policy('SecurityPreRules', 'shared')
+
+        profilepackage = ProfilePackage(
+            api_key='',
+            pan_config=pan_config,
+            settings=ConfigurationSettings().get_config(),
+            device_group_hierarchy_children={},
+            device_group_hierarchy_parent={},
+            device_groups_and_firewalls={},
+            device_groups=device_groups,
+            devicegroup_objects=devicegroup_objects,
+            devicegroup_exclusive_objects={},
+            rule_limit_enabled=False
+        )
+        return profilepackage
+
+    def test_processes_match_serial(self):
+        test_xml = """\
+        <response status="success"><result><config>
+          <shared>
+            <pre-rulebase><security><rules>
+              <entry name="enabled_rule"></entry>
+              <entry name="disabled_rule"><disabled>yes</disabled></entry>
+            </rules></security></pre-rulebase>
+            <address>
+              <entry name="valid_fqdn"><fqdn>valid.tld</fqdn></entry>
+              <entry name="ip_fqdn"><fqdn>127.0.0.1</fqdn></entry>
+            </address>
+          </shared>
+        </config></result></response>
+        """
+        pan_config = PanConfig(test_xml)
+        profilepackage = self.create_profilepackage(pan_config)
+        validators = {name: get_policy_validators()[name] for name in ('DisabledPolicies', 'FQDNContainsIP', 'ExtraZones')}
+
+        serial_problems, serial_total_problems, serial_total_checks = run_policy_validators(validators, profilepackage, '')
+        problems, total_problems, total_checks = run_policy_validators(validators, profilepackage, '', processes=2)
+
+        self.assertEqual(total_problems, 2)
+        self.assertEqual(total_problems, serial_total_problems)
+        self.assertEqual(total_checks, serial_total_checks)
+        self.assertEqual(list(problems.keys()), list(serial_problems.keys()))
+        for key, validator_problems in problems.items():
+            self.assertEqual([problem.text for problem in validator_problems],
+                             [problem.text for problem in serial_problems[key]])
+
+    @patch('palo_alto_firewall_analyzer.scripts.pan_analyzer.concurrent.futures.ProcessPoolExecutor')
+    def test_no_pool_for_main_process_validators(self, mocked_executor):
+        pan_config = PanConfig('<response status="success"><result><config><shared/></config></result></response>')
+        profilepackage = self.create_profilepackage(pan_config)
+        validators = {name: get_policy_validators()[name] for name in ('ExtraZones', 'BadHostname')}
+
+        problems, total_problems, total_checks = run_policy_validators(validators, profilepackage, '', processes=2)
+
+        mocked_executor.assert_not_called()
+        self.assertEqual(total_problems, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+import collections
+import unittest
+
+from palo_alto_firewall_analyzer.core import squash_all_devicegroups
+
+
+class TestSquashDevicegroups(unittest.TestCase):
+    def test_squash_all_devicegroups(self):
+        device_group_hierarchy_children = collections.defaultdict(list)
+        device_group_hierarchy_children['shared'] = ['root_dg']
+        device_group_hierarchy_children['root_dg'] = ['dg_b', 'dg_a']
+        device_group_hierarchy_children['dg_a'] = ['dg_a_child']
+        device_groups = ['root_dg', 'dg_a', 'dg_b', 'dg_a_child', 'shared']
+
+        squashed = squash_all_devicegroups(device_groups, device_group_hierarchy_children)
+
+        self.assertEqual(squashed['shared'], ['dg_a', 'dg_a_child', 'dg_b', 'root_dg', 'shared'])
+        self.assertEqual(squashed['root_dg'], ['dg_a', 'dg_a_child', 'dg_b', 'root_dg'])
+        self.assertEqual(squashed['dg_a'], ['dg_a', 'dg_a_child'])
+        self.assertEqual(squashed['dg_b'], ['dg_b'])
+        self.assertEqual(squashed['dg_a_child'], ['dg_a_child'])
+        # Leaf device groups shouldn't be added to the hierarchy
+        self.assertNotIn('dg_b', device_group_hierarchy_children)
+
+
+if __name__ == "__main__":
+    unittest.main()